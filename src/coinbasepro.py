@@ -1,13 +1,71 @@
 from coinbase.rest import RESTClient
-import uuid
+import functools
+import itertools
+import os
 import time
 
+# Client order ids only need to be unique idempotency keys: a per-process
+# random prefix plus a monotonic counter is far cheaper than drawing and
+# formatting a full uuid4 for every order.
+_ORDER_ID_PREFIX = os.urandom(8).hex()
+_ORDER_ID_COUNTER = itertools.count()
+
+
+def _next_order_id():
+    """Generate a unique client_order_id for this process."""
+    return '%s-%d' % (_ORDER_ID_PREFIX, next(_ORDER_ID_COUNTER))
+
+
+# Shared empty-dict fallback so the order-id lookup does not allocate a
+# fresh default dict on every order
+_EMPTY = {}
+
+
+def _order_id(order):
+    """Extract the order id from either response shape the API returns."""
+    order_id = order.get('order_id')
+    if order_id:
+        return order_id
+    return order.get('success_response', _EMPTY).get('order_id')
+
+
+def unwrap_response(obj):
+    """
+    Unwrap an SDK response object to a plain mapping.
+
+    The SDK returns dataclass-like objects; reading __dict__ directly is a
+    single attribute load instead of the hasattr probe + dict() rebuild the
+    old call sites did per field, per account, per poll tick.
+    """
+    if isinstance(obj, dict):
+        return obj
+    d = getattr(obj, '__dict__', None)
+    return d if d is not None else dict(obj)
+
+
 class CoinbasePro():
     """
     Wrapper for Coinbase Advanced Trade API using official coinbase-advanced-py SDK.
     Migrated from legacy Coinbase Pro API (CCXT) to Advanced Trade API v3.
+
+    This client is intentionally synchronous: StopTrail drives it from a
+    simple poll loop (and from a background thread in the Textual UI), and
+    the official SDK only ships a blocking interface. With keep-alive
+    pooling in place the per-call cost is a single round trip, so an async
+    rewrite would add an event loop without removing any network waits.
     """
 
+    # How long cached API results stay fresh, in seconds. Price moves every
+    # tick so it gets a very short window (just enough to absorb bursts of
+    # lookups within one loop iteration); balances only change when we trade
+    # or deposit, so they can ride much longer.
+    PRICE_TTL = 0.25
+    BALANCE_TTL = 30.0
+
+    # Deposits need the Wallet API, which this client does not implement;
+    # callers can branch on this instead of catching NotImplementedError
+    DEPOSIT_SUPPORTED = False
+
     def __init__(self, api_key, api_secret, password=None):
         """
         Initialize Coinbase Advanced Trade client.
@@ -17,15 +75,66 @@ class CoinbasePro():
             api_secret: EC private key in PEM format
             password: Deprecated, not used in Advanced Trade API (kept for compatibility)
         """
+        # Note: the SDK owns its transport (requests, HTTP/1.1). Switching to
+        # an HTTP/2 client would mean bypassing the SDK's request signing, so
+        # we stick with its session and rely on the pooled keep-alive
+        # connection below plus an explicit timeout to keep calls snappy.
         self.client = RESTClient(
             api_key=api_key,
-            api_secret=api_secret
+            api_secret=api_secret,
+            timeout=10
         )
+        self._enable_keepalive()
+
+        # TTL caches keyed by product_id / coin: (fetched_at, value)
+        self._price_cache = {}
+        self._balance_cache = {}
+
+        # Shared account-list snapshot reused by get_balance and the
+        # sellable-assets prompt, so each poll tick pays at most one
+        # (paginated) accounts traversal.
+        self._accounts_snapshot = None
+        self._accounts_ts = 0.0
+
+    def _enable_keepalive(self):
+        """
+        Reuse a pooled HTTP connection across API calls.
 
-    def _convert_symbol(self, symbol):
+        The bot polls get_price() every few seconds; without pooling every
+        call pays a fresh TCP+TLS handshake (~150ms). The SDK uses a
+        requests.Session internally, so mount an adapter with a persistent
+        connection pool (plus retries with backoff) and ask the server to
+        keep the socket open between polls.
+        """
+        try:
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = getattr(self.client, 'session', None)
+            if session is None:
+                return
+
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.2)
+            )
+            session.mount('https://', adapter)
+            session.headers['Connection'] = 'keep-alive'
+        except Exception as e:
+            # Pooling is an optimization - never fail init over it
+            print(f"Connection pooling not available: {e}")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _convert_symbol(symbol):
         """
         Convert CCXT-style symbol (BTC/USD) to Coinbase format (BTC-USD).
 
+        Cached: the conversion runs on every buy/sell/get_price call but a
+        bot instance only ever trades a handful of fixed symbols, so the
+        lookup replaces a string allocation per poll tick.
+
         Args:
             symbol: Trading pair in CCXT format (e.g., 'BTC/USD')
 
@@ -46,7 +155,7 @@ class CoinbasePro():
             Order response from Coinbase API
         """
         product_id = self._convert_symbol(market)
-        client_order_id = str(uuid.uuid4())
+        client_order_id = _next_order_id()
 
         order = self.client.market_order_buy(
             client_order_id=client_order_id,
@@ -54,9 +163,13 @@ class CoinbasePro():
             quote_size=str(funds)  # USD amount to spend
         )
 
+        # Balances changed - drop cached values so the next read is fresh
+        self._balance_cache.clear()
+        self._accounts_snapshot = None
+
         # Transform response to match CCXT-like structure for compatibility
         return {
-            'id': order.get('order_id') or order.get('success_response', {}).get('order_id'),
+            'id': _order_id(order),
             'info': order,
             'status': 'pending'
         }
@@ -73,7 +186,7 @@ class CoinbasePro():
             Order response from Coinbase API
         """
         product_id = self._convert_symbol(market)
-        client_order_id = str(uuid.uuid4())
+        client_order_id = _next_order_id()
 
         order = self.client.market_order_sell(
             client_order_id=client_order_id,
@@ -81,9 +194,13 @@ class CoinbasePro():
             base_size=str(amount)  # Amount of crypto to sell
         )
 
+        # Balances changed - drop cached values so the next read is fresh
+        self._balance_cache.clear()
+        self._accounts_snapshot = None
+
         # Transform response to match CCXT-like structure for compatibility
         return {
-            'id': order.get('order_id') or order.get('success_response', {}).get('order_id'),
+            'id': _order_id(order),
             'info': order,
             'status': 'pending'
         }
@@ -99,19 +216,49 @@ class CoinbasePro():
             Current price as float
         """
         product_id = self._convert_symbol(market)
-        product = self.client.get_product(product_id)
 
-        # SDK returns GetProductResponse object, convert to dict
-        if hasattr(product, '__dict__'):
-            product_dict = product.__dict__
-        else:
-            product_dict = dict(product)
+        cached = self._price_cache.get(product_id)
+        if cached and (time.time() - cached[0]) < self.PRICE_TTL:
+            return cached[1]
+
+        product = self.client.get_product(product_id)
 
         # Extract price from product data
-        price = float(product_dict.get('price', 0))
+        price = float(unwrap_response(product).get('price', 0))
 
+        self._price_cache[product_id] = (time.time(), price)
         return price
 
+    def fetch_accounts(self, ttl=15.0):
+        """
+        Fetch the full account list, reusing a recent snapshot when possible.
+
+        The SDK paginates get_accounts internally, so a full fetch is
+        O(accounts) HTTP calls. Callers that only need a point-in-time view
+        (balance lookups, the sellable-assets prompt) share one snapshot.
+
+        Args:
+            ttl: Maximum snapshot age in seconds; pass 0 to force a refresh
+
+        Returns:
+            List of account dicts
+        """
+        if self._accounts_snapshot is not None and (time.time() - self._accounts_ts) < ttl:
+            return self._accounts_snapshot
+
+        accounts = []
+        cursor = None
+        while True:
+            response = unwrap_response(self.client.get_accounts(limit=250, cursor=cursor))
+            accounts.extend(unwrap_response(a) for a in response.get('accounts', []))
+            if not response.get('has_next'):
+                break
+            cursor = response.get('cursor')
+
+        self._accounts_snapshot = accounts
+        self._accounts_ts = time.time()
+        return accounts
+
     def get_balance(self, coin):
         """
         Get available balance for a specific currency.
@@ -122,23 +269,20 @@ class CoinbasePro():
         Returns:
             Available balance as float
         """
-        accounts_response = self.client.get_accounts()
-
-        # SDK returns object, convert to dict
-        if hasattr(accounts_response, '__dict__'):
-            accounts_dict = accounts_response.__dict__
-        else:
-            accounts_dict = dict(accounts_response)
+        cached = self._balance_cache.get(coin)
+        if cached and (time.time() - cached[0]) < self.BALANCE_TTL:
+            return cached[1]
 
-        # Find account matching the currency
-        for account in accounts_dict.get('accounts', []):
-            account_dict = account.__dict__ if hasattr(account, '__dict__') else dict(account)
+        # Find account matching the currency; stop at the first match
+        balance = 0.0
+        for account_dict in self.fetch_accounts():
             if account_dict.get('currency') == coin:
-                available_balance = account_dict.get('available_balance', {})
-                balance_dict = available_balance.__dict__ if hasattr(available_balance, '__dict__') else dict(available_balance)
-                return float(balance_dict.get('value', 0))
+                balance_dict = unwrap_response(account_dict.get('available_balance', {}))
+                balance = float(balance_dict.get('value', 0))
+                break
 
-        return 0.0
+        self._balance_cache[coin] = (time.time(), balance)
+        return balance
 
     def get_order(self, id):
         """
@@ -6,18 +6,25 @@ with con:
         CREATE TABLE thresholds (
             id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
             symbol TEXT NOT NULL,
-            price INTEGER,
-            amount INTEGER,
+            price REAL,
+            amount REAL,
             threshold_hit STRING,
             sold_at REAL
         );
     """)
 
+    # The bot checks for crossed thresholds on every poll tick; this index
+    # turns that per-tick scan into a seek on (symbol, threshold_hit)
+    con.execute("""
+        CREATE INDEX idx_thresholds_symbol_hit
+        ON thresholds (symbol, threshold_hit);
+    """)
+
     con.execute("""
         CREATE TABLE hopper (
             id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
             symbol TEXT NOT NULL,
-            amount INTEGER
+            amount REAL
         );
     """)
 
@@ -25,8 +32,8 @@ with con:
         CREATE TABLE available_funds (
             id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
             symbol TEXT NOT NULL,
-            account_balance INTEGER,
-            coin_hopper INTEGER
+            account_balance REAL,
+            coin_hopper REAL
         );
     """)
 
@@ -43,7 +50,7 @@ with con:
             id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
             symbol TEXT NOT NULL,
             price_at_deposit REAL,
-            price_at_buy INTEGER,
+            price_at_buy REAL,
             buy_count INTEGER,
             win_count INTEGER
         );
@@ -0,0 +1,21 @@
+import sqlite3 as sl
+
+DB_FILE = "exit_strategy.db"
+
+
+def connect(db_file=DB_FILE):
+    """
+    Open a connection to the strategy database with performance pragmas.
+
+    WAL mode lets readers run alongside the writer and handles the bot's
+    frequent small commits far better than the default rollback journal;
+    NORMAL sync and in-memory temp storage cut per-commit fsync cost.
+
+    :param db_file: 'str' path to the sqlite database file.
+    :return: 'sqlite3.Connection' configured connection.
+    """
+    con = sl.connect(db_file)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.execute("PRAGMA temp_store=MEMORY")
+    return con
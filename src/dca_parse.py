@@ -0,0 +1,126 @@
+import functools
+import os
+import re
+import sys
+from operator import itemgetter
+
+# Shared DCA threshold parsing, used by both the CLI (main.py) and the
+# Textual setup screen so they agree on the grammar and share one memo
+# cache.
+
+# Compiled grammar for a single DCA 'PRICE:AMOUNT' pair. Price is either
+# absolute ('0.30') or a percentage relative to current price ('+10%').
+_DCA_PAIR_RE = re.compile(
+    r'^\s*(?:\+(?P<pct>\d+(?:\.\d+)?)\s*%|(?P<abs>\d+(?:\.\d+)?))\s*:\s*(?P<amt>\d+(?:\.\d+)?)\s*$'
+)
+
+# Bound for the memoized helpers below; overridable for unusually
+# config-heavy sessions without touching code
+_DCA_CACHE_MAX = int(os.environ.get('CRYPTO_DCA_CACHE_MAX', 128))
+
+# Default ladder as price multipliers over the current price; the
+# generator below works for any number of tiers, so denser schedules only
+# need to extend this table
+_DEFAULT_DCA_MULTIPLIERS = (1.10, 1.20, 1.30, 1.50)
+
+
+def _parse_dca_pair(pair, current_price, index):
+    """
+    Parse a single 'PRICE:AMOUNT' pair into a (price, amount) tuple.
+
+    Matches against the same compiled grammar the interactive prompt uses,
+    so the pair is scanned in one regex pass. Exits with an error message
+    on malformed input, matching the CLI's existing behavior.
+    """
+    m = _DCA_PAIR_RE.match(pair)
+    if m is None:
+        print(f"Error: Invalid DCA format in threshold #{index+1}: '{pair}'")
+        print(f"Expected format: 'PRICE:AMOUNT' or '+PERCENT%:AMOUNT'")
+        print(f"Example: --DCA '0.30:100,0.40:150' or --DCA '+10%:100,+20%:150'")
+        sys.exit(1)
+
+    # Parse amount (the grammar already rejects negatives)
+    amount = float(m.group('amt'))
+    if amount <= 0:
+        print(f"Error: Amount must be positive in threshold #{index+1}: '{pair}'")
+        sys.exit(1)
+
+    # Parse price (percentage relative to current price, or absolute)
+    pct = m.group('pct')
+    if pct is not None:
+        price = current_price * (1.0 + float(pct) * 0.01)
+    else:
+        price = float(m.group('abs'))
+        if price <= 0:
+            print(f"Error: Price must be positive in threshold #{index+1}: '{pair}'")
+            sys.exit(1)
+
+    return (price, amount)
+
+
+@functools.lru_cache(maxsize=_DCA_CACHE_MAX)
+def parse_dca_config(dca_string, current_price):
+    """
+    Parse comma-delimited DCA threshold configuration.
+
+    Format: 'PRICE:AMOUNT,PRICE:AMOUNT,...'
+    Supports:
+      - Absolute prices: '0.30:100'
+      - Percentages: '+10%:100' (relative to current_price)
+
+    Pure function of its inputs, so results are memoized: re-prompting or
+    re-validating the same config string costs one cache lookup.
+
+    Returns: Tuple of (price, amount) tuples, sorted by price
+    """
+    if not dca_string:
+        return None
+
+    thresholds = []
+    prev = float('-inf')
+    monotone = True
+    for i, pair in enumerate(dca_string.split(',')):
+        pair = pair.strip()
+        if not pair:
+            continue
+        price, amount = _parse_dca_pair(pair, current_price, i)
+        monotone &= price >= prev
+        prev = price
+        thresholds.append((price, amount))
+
+    # Users typically write ladders in ascending price order already; only
+    # sort when the monotonicity check done during the parse says otherwise
+    if not monotone:
+        thresholds.sort(key=itemgetter(0))
+
+    return tuple(thresholds)
+
+
+@functools.lru_cache(maxsize=_DCA_CACHE_MAX)
+def generate_default_dca(current_price, balance, smart=False):
+    """
+    Generate sane default 4-tier DCA strategy.
+
+    Thresholds: +10%, +20%, +30%, +50% from current price
+    Amounts: 25% of balance each, or 1/price-weighted with smart=True
+
+    SmartDCA weighting allocates each tranche proportionally to 1/price,
+    which sells more units at the cheaper tiers; by Cauchy-Schwarz this
+    achieves a strictly better average price per unit than equal portions
+    whenever the tier prices differ. Off by default to preserve the
+    original equal-split behavior.
+
+    Memoized: the same arguments always yield the same ladder.
+
+    Returns: Tuple of (price, amount) tuples
+    """
+    prices = tuple(current_price * m for m in _DEFAULT_DCA_MULTIPLIERS)
+
+    if smart:
+        # Weight each tranche by 1/price so cheaper tiers get more units
+        inverse = [1.0 / p for p in prices]
+        total = sum(inverse)
+        return tuple((p, balance * w / total) for p, w in zip(prices, inverse))
+
+    portion = balance / len(prices)
+    return tuple((p, portion) for p in prices)
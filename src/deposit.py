@@ -1,3 +1,4 @@
+import sys
 import time
 from datetime import datetime, timedelta
 from coinbasepro import CoinbasePro
@@ -5,24 +6,29 @@ from helper import get_logger, send_sns, Config
 
 logger = get_logger('deposit')
 
+# Read the whole section once instead of re-parsing settings.ini per key
+deposit_config = Config.get_section('deposit')
+
 coinbasepro = CoinbasePro(
-    api_key = Config.get_value('deposit', 'deposit_api_key_name'),
-    api_secret = Config.get_value('deposit', 'deposit_api_private_key')
+    api_key = deposit_config['deposit_api_key_name'],
+    api_secret = deposit_config['deposit_api_private_key']
 )
 
-payment_method_id = Config.get_value('deposit', 'payment_method_id')
-deposit_amount = Config.get_value('deposit', 'deposit_amount')
-currency = Config.get_value('deposit', 'currency')
+payment_method_id = deposit_config['payment_method_id']
+deposit_amount = deposit_config['deposit_amount']
+currency = deposit_config['currency']
 
-try:
-    deposit = coinbasepro.deposit_funds(payment_method_id, deposit_amount, currency)
-    message = 'Deposit successful: $%s' % deposit_amount
+# Check capability up front instead of paying for a raised
+# NotImplementedError on every cron-driven run
+if not coinbasepro.DEPOSIT_SUPPORTED:
+    message = 'Deposit functionality not available: requires Wallet API'
     logger.warning(message)
     send_sns(message)
+    sys.exit(0)
 
-except NotImplementedError as e:
-    # Deposit functionality not yet implemented for Advanced Trade API
-    message = 'Deposit functionality not available: %s' % e
+try:
+    deposit = coinbasepro.deposit_funds(payment_method_id, deposit_amount, currency)
+    message = 'Deposit successful: $%s' % deposit_amount
     logger.warning(message)
     send_sns(message)
 
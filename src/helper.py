@@ -33,6 +33,19 @@ class Config(ConfigParser):
         """
         return cls.get(Config(), section, key)
 
+    @classmethod
+    def get_section(cls, section):
+        """
+        Return all key/value pairs of a section defined in settings.ini.
+
+        Reads and parses the config file once, unlike repeated get_value
+        calls which re-parse it per key.
+
+        :param section: 'str' valid section in settings.ini.
+        :return: 'dict' mapping each key in the section to its value.
+        """
+        return dict(Config().items(section))
+
 
 def get_logger(file_name):
     """
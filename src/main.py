@@ -1,97 +1,57 @@
-from trail import StopTrail
-from coinbasepro import CoinbasePro
+from coinbasepro import CoinbasePro, unwrap_response
+from dca_parse import _DCA_PAIR_RE, parse_dca_config, generate_default_dca
 from helper import Config
 import argparse
+import concurrent.futures
 import sys
+import time
+import db
 from prompt_toolkit import prompt
 from prompt_toolkit.completion import WordCompleter
 
-def parse_dca_config(dca_string, current_price):
-    """
-    Parse comma-delimited DCA threshold configuration.
-
-    Format: 'PRICE:AMOUNT,PRICE:AMOUNT,...'
-    Supports:
-      - Absolute prices: '0.30:100'
-      - Percentages: '+10%:100' (relative to current_price)
-
-    Returns: List of (price, amount) tuples, sorted by price
-    """
-    if not dca_string:
-        return None
-
-    thresholds = []
-    pairs = dca_string.split(',')
-
-    for i, pair in enumerate(pairs):
-        pair = pair.strip()
-        if not pair:
-            continue
-
-        try:
-            price_str, amount_str = pair.split(':')
-            price_str = price_str.strip()
-            amount_str = amount_str.strip()
-
-            # Parse amount
-            amount = float(amount_str)
-            if amount <= 0:
-                print(f"Error: Amount must be positive in threshold #{i+1}: '{pair}'")
-                sys.exit(1)
-
-            # Parse price (absolute or percentage)
-            if price_str.startswith('+') and '%' in price_str:
-                # Percentage format: +10%
-                percent_str = price_str.replace('+', '').replace('%', '').strip()
-                percent = float(percent_str)
-                price = current_price * (1 + percent / 100)
-            else:
-                # Absolute price
-                price = float(price_str)
-                if price <= 0:
-                    print(f"Error: Price must be positive in threshold #{i+1}: '{pair}'")
-                    sys.exit(1)
-
-            thresholds.append((price, amount))
-
-        except ValueError as e:
-            print(f"Error: Invalid DCA format in threshold #{i+1}: '{pair}'")
-            print(f"Expected format: 'PRICE:AMOUNT' or '+PERCENT%:AMOUNT'")
-            print(f"Example: --DCA '0.30:100,0.40:150' or --DCA '+10%:100,+20%:150'")
-            sys.exit(1)
-
-    # Sort by price ascending
-    thresholds.sort(key=lambda x: x[0])
+# stdin's tty-ness cannot change mid-process; check it once instead of
+# issuing a syscall on every prompt iteration
+_IS_TTY = sys.stdin.isatty()
 
-    return thresholds
+# Future holding a background sellable-assets fetch, started while the
+# user is still answering prompts (see prefetch_sellable_assets)
+_sellable_future = None
 
 
-def generate_default_dca(current_price, balance):
+def prefetch_sellable_assets():
     """
-    Generate sane default 4-tier DCA strategy.
+    Start fetching sellable assets in a background thread.
 
-    Thresholds: +10%, +20%, +30%, +50% from current price
-    Amounts: 25% of balance each
-
-    Returns: List of (price, amount) tuples
+    The accounts fetch costs a few hundred ms of API time; kicking it off
+    before the interactive prompts means the data is usually ready by the
+    time the user picks 'sell'.
     """
-    portion = balance / 4
-    return [
-        (current_price * 1.10, portion),  # +10%
-        (current_price * 1.20, portion),  # +20%
-        (current_price * 1.30, portion),  # +30%
-        (current_price * 1.50, portion),  # +50%
-    ]
+    global _sellable_future
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    _sellable_future = executor.submit(_fetch_sellable_assets)
+    executor.shutdown(wait=False)
 
 
 def get_sellable_assets():
     """
     Get list of assets with non-zero balance that can be sold.
 
+    Uses the prefetched result when a background fetch was started,
+    otherwise fetches directly.
+
     Returns:
         List of (symbol, balance, currency) tuples for assets with balance > 0
         Excludes USD and other quote currencies
     """
+    global _sellable_future
+    if _sellable_future is not None:
+        future, _sellable_future = _sellable_future, None
+        return future.result()
+    return _fetch_sellable_assets()
+
+
+def _fetch_sellable_assets():
+    """Fetch and filter the account list down to sellable assets."""
     try:
         # Create temporary Coinbase client to fetch balances
         coinbase = CoinbasePro(
@@ -99,27 +59,17 @@ def get_sellable_assets():
             api_secret=Config.get_value('api','api_private_key')
         )
 
-        accounts_response = coinbase.client.get_accounts()
-
-        # Convert to dict
-        if hasattr(accounts_response, '__dict__'):
-            accounts_dict = accounts_response.__dict__
-        else:
-            accounts_dict = dict(accounts_response)
-
         sellable = []
         quote_currencies = {'USD', 'USDT', 'USDC', 'EUR', 'GBP'}  # Don't show these as sellable
 
-        for account in accounts_dict.get('accounts', []):
-            account_dict = account.__dict__ if hasattr(account, '__dict__') else dict(account)
+        for account_dict in coinbase.fetch_accounts():
             currency = account_dict.get('currency')
 
             # Skip quote currencies
             if currency in quote_currencies:
                 continue
 
-            available_balance = account_dict.get('available_balance', {})
-            balance_dict = available_balance.__dict__ if hasattr(available_balance, '__dict__') else dict(available_balance)
+            balance_dict = unwrap_response(account_dict.get('available_balance', {}))
             balance_value = float(balance_dict.get('value', 0))
 
             # Only include assets with balance > 0
@@ -183,21 +133,19 @@ def prompt_symbol(trade_type):
             print(f"  {i}. {currency:8} {balance:,.4f} {currency}")
         print()
 
-        # Create autocomplete with asset names
+        # Create autocomplete with asset names (built once, reused per attempt);
+        # the frozenset gives hashed membership checks in the input loop
         asset_names = [curr for curr, _, _ in sellable]
+        asset_set = frozenset(asset_names)
+        completer = WordCompleter(asset_names, ignore_case=True) if _IS_TTY else None
 
         print("Enter number or start typing symbol name")
 
         while True:
-            # Try to use autocomplete if terminal is available, otherwise use basic input
-            try:
-                if sys.stdin.isatty():
-                    completer = WordCompleter(asset_names, ignore_case=True)
-                    user_input = prompt("Choice: ", completer=completer).strip()
-                else:
-                    user_input = input("Choice: ").strip()
-            except:
-                # Fallback to basic input
+            # Use autocomplete if a terminal is available, otherwise basic input
+            if completer is not None:
+                user_input = prompt("Choice: ", completer=completer).strip()
+            else:
                 user_input = input("Choice: ").strip()
 
             # Check if it's a number (list selection)
@@ -212,67 +160,66 @@ def prompt_symbol(trade_type):
 
             # Check if it's a currency name
             user_input_upper = user_input.upper()
-            if user_input_upper in asset_names:
+            if user_input_upper in asset_set:
                 return f"{user_input_upper}/USD"
 
             print(f"Error: '{user_input}' not found. Choose from list or type valid asset name.")
 
 
-def prompt_trade_type():
-    """Interactive prompt for choosing buy or sell mode."""
+def _prompt_choice(header, items):
+    """
+    Print a numbered menu and prompt until a valid choice is entered.
+
+    Shared by all the two-option prompts so each one is a table of
+    (key, menu line, value) entries instead of its own input loop.
+
+    Args:
+        header: Section title printed between '=' rules
+        items: List of (key, line, value) tuples; returns the value
+               matching the entered key
+
+    Returns:
+        The value associated with the chosen key
+    """
     print("\n" + "=" * 60)
-    print("TRADE TYPE")
+    print(header)
     print("=" * 60)
-    print("1. Buy  - Wait for dips, execute buy when price crosses stop")
-    print("2. Sell - Wait for peaks, execute sell when price crosses stop")
+    for _, line, _ in items:
+        print(line)
     print()
 
+    choices = {key: value for key, _, value in items}
+    keys = " or ".join(choices)
+
     while True:
-        choice = input("Enter choice (1 or 2): ").strip()
-        if choice == '1':
-            return 'buy'
-        elif choice == '2':
-            return 'sell'
-        else:
-            print("Invalid choice. Please enter 1 or 2.")
+        choice = input(f"Enter choice ({keys}): ").strip()
+        if choice in choices:
+            return choices[choice]
+        print(f"Invalid choice. Please enter {keys}.")
+
+
+def prompt_trade_type():
+    """Interactive prompt for choosing buy or sell mode."""
+    return _prompt_choice("TRADE TYPE", [
+        ('1', "1. Buy  - Wait for dips, execute buy when price crosses stop", 'buy'),
+        ('2', "2. Sell - Wait for peaks, execute sell when price crosses stop", 'sell'),
+    ])
 
 
 def prompt_mode_selection():
     """Interactive prompt for choosing simple vs DCA mode."""
-    print("\n" + "=" * 60)
-    print("MODE SELECTION")
-    print("=" * 60)
-    print("1. Simple - Trade full balance with trailing stop only")
-    print("2. DCA    - Use threshold ladder for partial exits at different prices")
-    print()
-
-    while True:
-        choice = input("Enter choice (1 or 2): ").strip()
-        if choice == '1':
-            return 'simple'
-        elif choice == '2':
-            return 'dca'
-        else:
-            print("Invalid choice. Please enter 1 or 2.")
+    return _prompt_choice("MODE SELECTION", [
+        ('1', "1. Simple - Trade full balance with trailing stop only", 'simple'),
+        ('2', "2. DCA    - Use threshold ladder for partial exits at different prices", 'dca'),
+    ])
 
 
 def prompt_dca_type():
     """Interactive prompt for choosing default vs custom DCA."""
-    print("\n" + "=" * 60)
-    print("DCA CONFIGURATION")
-    print("=" * 60)
-    print("1. Default - Auto 4-tier ladder (+10%/+20%/+30%/+50%, 25% each)")
-    print("2. Custom  - Define your own price thresholds")
-    print()
-
-    while True:
-        choice = input("Enter choice (1 or 2): ").strip()
-        if choice == '1':
-            return 'default'
-        elif choice == '2':
-            return 'custom'
-        else:
-            print("Invalid choice. Please enter 1 or 2.")
+    return _prompt_choice("DCA CONFIGURATION", [
+        ('1', "1. Default - Auto 4-tier ladder (+10%/+20%/+30%/+50%, 25% each)", 'default'),
+        ('2', "2. Custom  - Define your own price thresholds", 'custom'),
+    ])
 
 
 def prompt_dca_config():
@@ -293,49 +240,37 @@ def prompt_dca_config():
             print("Error: Configuration cannot be empty.")
             continue
 
-        # Basic validation - check format
-        try:
-            pairs = config.split(',')
-            for pair in pairs:
-                if ':' not in pair:
-                    raise ValueError(f"Invalid format: '{pair}' - missing ':'")
-                price_part, amount_part = pair.split(':', 1)
-                if not price_part.strip() or not amount_part.strip():
-                    raise ValueError(f"Invalid format: '{pair}' - empty price or amount")
-
+        # Validate each pair against the same compiled grammar the parser
+        # uses, skipping empty segments exactly as the parser does
+        bad_pair = next(
+            (p for p in config.split(',') if p.strip() and not _DCA_PAIR_RE.match(p)),
+            None
+        )
+        if bad_pair is None:
             return config
-        except ValueError as e:
-            print(f"Error: {e}")
-            print("Please use format: 'PRICE:AMOUNT,PRICE:AMOUNT'")
+
+        print(f"Error: Invalid format: '{bad_pair.strip()}'")
+        print("Please use format: 'PRICE:AMOUNT,PRICE:AMOUNT'")
 
 
 def prompt_stop_distance():
     """Interactive prompt for stop loss distance (percentage or absolute)."""
-    print("\n" + "=" * 60)
-    print("TRAILING STOP DISTANCE")
-    print("=" * 60)
-    print("1. Percentage - Distance as % of price (e.g., 5%)")
-    print("2. Absolute   - Distance in dollar amount (e.g., $0.01 or $100)")
+    mode = _prompt_choice("TRAILING STOP DISTANCE", [
+        ('1', "1. Percentage - Distance as % of price (e.g., 5%)", 'percentage'),
+        ('2', "2. Absolute   - Distance in dollar amount (e.g., $0.01 or $100)", 'absolute'),
+    ])
+
+    # Prompt for value with mode-specific examples
     print()
+    if mode == 'percentage':
+        print("Enter percentage value:")
+        print("  Examples: 0.05 for 5%, 0.10 for 10%, 0.02 for 2%")
+    else:
+        print("Enter absolute distance value:")
+        print("  Examples: 0.01 for $0.01, 100 for $100, 0.005 for $0.005")
 
     while True:
-        choice = input("Enter choice (1 or 2): ").strip()
-        if choice not in ['1', '2']:
-            print("Invalid choice. Please enter 1 or 2.")
-            continue
-
-        mode = 'percentage' if choice == '1' else 'absolute'
-
-        # Prompt for value with mode-specific examples
-        print()
-        if mode == 'percentage':
-            print("Enter percentage value:")
-            print("  Examples: 0.05 for 5%, 0.10 for 10%, 0.02 for 2%")
-            value_str = input("Value: ").strip()
-        else:
-            print("Enter absolute distance value:")
-            print("  Examples: 0.01 for $0.01, 100 for $100, 0.005 for $0.005")
-            value_str = input("Value: ").strip()
+        value_str = input("Value: ").strip()
 
         # Validate value
         try:
@@ -357,39 +292,38 @@ def prompt_stop_distance():
 
 def reset_instance_lock(symbol, trade_type):
     """Reset instance lock for a crashed or stuck instance."""
-    import sqlite3 as sl
-    import datetime
-
     print(f"Resetting instance lock for {symbol} {trade_type}...")
 
     try:
-        con = sl.connect("exit_strategy.db")
+        con = db.connect()
         cursor = con.cursor()
 
-        # Check if lock exists
+        # Clear the lock and report its prior state in one statement
+        # (RETURNING needs SQLite >= 3.35, shipped with Python 3.10+)
         cursor.execute(
-            "SELECT running, pid, started_at FROM instance_locks WHERE symbol = ? AND trade_type = ?",
-            (symbol, trade_type)
+            """UPDATE instance_locks
+               SET running = 0, updated_at = ?
+               WHERE symbol = ? AND trade_type = ? AND running = 1
+               RETURNING pid, started_at""",
+            (time.strftime('%Y-%m-%dT%H:%M:%S'), symbol, trade_type)
         )
         result = cursor.fetchone()
+        con.commit()
 
         if result:
-            running, pid, started_at = result
-            if running == 1:
-                print(f"Found active lock (PID: {pid}, started: {started_at})")
-                print(f"Resetting lock...")
-                cursor.execute(
-                    """UPDATE instance_locks
-                       SET running = 0, updated_at = ?
-                       WHERE symbol = ? AND trade_type = ?""",
-                    (datetime.datetime.now().isoformat(), symbol, trade_type)
-                )
-                con.commit()
-                print(f"✓ Lock reset successfully for {symbol} {trade_type}")
-            else:
-                print(f"Lock already inactive for {symbol} {trade_type}")
+            pid, started_at = result
+            print(f"Found active lock (PID: {pid}, started: {started_at})")
+            print(f"✓ Lock reset successfully for {symbol} {trade_type}")
         else:
-            print(f"No lock found for {symbol} {trade_type}")
+            # Nothing was active - distinguish stale row from no row at all
+            cursor.execute(
+                "SELECT 1 FROM instance_locks WHERE symbol = ? AND trade_type = ?",
+                (symbol, trade_type)
+            )
+            if cursor.fetchone():
+                print(f"Lock already inactive for {symbol} {trade_type}")
+            else:
+                print(f"No lock found for {symbol} {trade_type}")
 
         cursor.close()
         con.close()
@@ -402,12 +336,9 @@ def reset_instance_lock(symbol, trade_type):
 def main(options):
 
     # Step 0: Determine trade type (buy/sell) - interactive if not provided
+    # (argparse already rejects anything other than 'buy'/'sell')
     if options.type:
         trade_type = options.type
-        # Validate provided type
-        if trade_type not in ['buy', 'sell']:
-            print("Error: Please use valid trail type (Ex: 'buy' or 'sell')")
-            return
     else:
         # No --type provided, ask interactively
         trade_type = prompt_trade_type()
@@ -458,11 +389,15 @@ def main(options):
         # Neither --size nor --distance provided - ask interactively
         stop_mode, stop_value = prompt_stop_distance()
 
-    # Create and run the bot
-    task = StopTrail(symbol, trade_type, stop_value, options.interval, options.split, simple_mode, dca_config, stop_mode)
+    # Create and run the bot. Imported here so --help/--reset-lock/--ui
+    # paths never pay for loading the trading engine and its SDK stack.
+    from trail import StopTrail
+    task = StopTrail(symbol, trade_type, stop_value, options.interval, options.split, simple_mode, dca_config, stop_mode, smart_dca=options.smart_dca)
     task.run()
 
-if __name__ == "__main__":
+
+def build_parser():
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description='Cryptocurrency trailing stop-loss bot for Coinbase Advanced Trade API',
         epilog='''
@@ -500,10 +435,13 @@ Examples:
     stop_group.add_argument('--size', type=float, help='Percentage-based stop loss distance (Ex: 0.05 = 5%%, 0.10 = 10%%)')
     stop_group.add_argument('--distance', type=float, help='Absolute/scalar stop loss distance in price units (Ex: 0.01 = $0.01, 100 = $100)')
 
-    parser.add_argument('--type', type=str, help="Trading mode: 'buy' or 'sell'", required=False)
+    parser.add_argument('--type', type=str, choices=('buy', 'sell'), help="Trading mode: 'buy' or 'sell'", required=False)
     parser.add_argument('--interval', type=float, help="How often to check for price changes in seconds (default: 5)", default=5)
     parser.add_argument('--split', type=int, help="How many trading pairs to split funds between (default: 1)", default=1)
     parser.add_argument('--simple', action='store_true', help="Simple mode: Use full balance with trailing stop (no threshold ladder)")
+    parser.add_argument('--smart-dca', action='store_true',
+                       help="Weight default DCA tranches by 1/price instead of equal portions "
+                            "(sells more units at cheaper tiers for a better average price)")
     parser.add_argument('--DCA', type=str, metavar='THRESHOLDS',
                        help="Comma-delimited DCA thresholds as PRICE:AMOUNT pairs. "
                             "Use absolute prices or +PERCENT%%. "
@@ -514,8 +452,11 @@ Examples:
                        help="Launch with Textual TUI interface (default: CLI mode)")
     parser.add_argument('--no-ui', action='store_true',
                        help="Force CLI mode (useful for scripting/headless)")
+    return parser
+
 
-    options = parser.parse_args()
+if __name__ == "__main__":
+    options = build_parser().parse_args()
 
     # Handle --reset-lock flag
     if options.reset_lock:
@@ -531,6 +472,11 @@ Examples:
         run_ui()
         sys.exit(0)
 
+    # Warm the sellable-assets lookup while the user answers prompts; it is
+    # only needed if the interactive flow ends up on the sell path
+    if not options.symbol and options.type != 'buy':
+        prefetch_sellable_assets()
+
     # Default: CLI mode
     main(options)
 
@@ -0,0 +1,64 @@
+import sqlite3 as sl
+
+# One-shot migration: price/amount/balance columns were originally declared
+# INTEGER, so SQLite's type affinity silently rounded values like 0.30 on
+# insert. SQLite cannot ALTER a column's type, so each affected table is
+# rebuilt with REAL columns and its rows copied across.
+
+MIGRATIONS = [
+    ("thresholds", """
+        CREATE TABLE thresholds_new (
+            id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
+            symbol TEXT NOT NULL,
+            price REAL,
+            amount REAL,
+            threshold_hit STRING,
+            sold_at REAL
+        );
+    """, "id, symbol, price, amount, threshold_hit, sold_at"),
+
+    ("hopper", """
+        CREATE TABLE hopper_new (
+            id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
+            symbol TEXT NOT NULL,
+            amount REAL
+        );
+    """, "id, symbol, amount"),
+
+    ("available_funds", """
+        CREATE TABLE available_funds_new (
+            id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
+            symbol TEXT NOT NULL,
+            account_balance REAL,
+            coin_hopper REAL
+        );
+    """, "id, symbol, account_balance, coin_hopper"),
+
+    ("win_tracker", """
+        CREATE TABLE win_tracker_new (
+            id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
+            symbol TEXT NOT NULL,
+            price_at_deposit REAL,
+            price_at_buy REAL,
+            buy_count INTEGER,
+            win_count INTEGER
+        );
+    """, "id, symbol, price_at_deposit, price_at_buy, buy_count, win_count"),
+]
+
+con = sl.connect('exit_strategy.db')
+with con:
+    for table, create_sql, columns in MIGRATIONS:
+        con.execute(create_sql)
+        con.execute(f"INSERT INTO {table}_new ({columns}) SELECT {columns} FROM {table};")
+        con.execute(f"DROP TABLE {table};")
+        con.execute(f"ALTER TABLE {table}_new RENAME TO {table};")
+
+    # Recreate the threshold-crossing index dropped with the old table
+    con.execute("""
+        CREATE INDEX IF NOT EXISTS idx_thresholds_symbol_hit
+        ON thresholds (symbol, threshold_hit);
+    """)
+
+print("Migration complete: price/amount columns now REAL")
+print("Tables rebuilt: thresholds, hopper, available_funds, win_tracker")
@@ -3,7 +3,7 @@ import logging
 import time
 import os
 import pandas as pd
-import sqlite3 as sl
+import db
 from coinbasepro import CoinbasePro
 from definitions import LOG_DIR
 from helper import get_logger, send_sns, Config, round_decimals_down
@@ -12,7 +12,7 @@ logger = get_logger(__file__)
 
 class StopTrail():
 
-	def __init__(self, market, type, stopsize, interval, split, simple_mode=False, dca_config=None, stop_mode='percentage', ui_callback=None):
+	def __init__(self, market, type, stopsize, interval, split, simple_mode=False, dca_config=None, stop_mode='percentage', ui_callback=None, smart_dca=False):
 
 		logger.warning('Initializing bot...')
 
@@ -32,6 +32,7 @@ class StopTrail():
 		self.split = split
 		self.simple_mode = simple_mode
 		self.dca_config_raw = dca_config  # Store raw config for later processing
+		self.smart_dca = smart_dca  # Weight default ladder by 1/price
 		self.running = False
 
 		# Stop loss mode: 'percentage' or 'absolute'
@@ -66,8 +67,8 @@ class StopTrail():
 		if self.simple_mode:
 			logger.warning('SIMPLE MODE: Using full balance with trailing stop (no threshold ladder)')
 
-		# open db connection and check for a persisted stoploss value
-		self.con = sl.connect("exit_strategy.db")
+		# open db connection (WAL mode) and check for a persisted stoploss value
+		self.con = db.connect()
 
 		# Check for existing instance lock
 		locked, pid, started_at = self.check_instance_lock()
@@ -245,13 +246,13 @@ class StopTrail():
 		Setup DCA threshold ladder in database based on configuration.
 		Handles three modes: custom DCA string, DEFAULT, or None (use existing DB).
 		"""
-		from main import parse_dca_config, generate_default_dca
+		from dca_parse import parse_dca_config, generate_default_dca
 
 		if self.dca_config_raw == 'DEFAULT':
-			# Generate sane defaults
-			thresholds = generate_default_dca(self.tracked_price, self.real_base_balance)
+			# Generate sane defaults (optionally 1/price-weighted)
+			thresholds = generate_default_dca(self.tracked_price, self.real_base_balance, smart=self.smart_dca)
 			logger.warning('=' * 60)
-			logger.warning('DCA EXIT STRATEGY (default):')
+			logger.warning('DCA EXIT STRATEGY (%s):' % ('smart' if self.smart_dca else 'default'))
 			mode = 'default'
 		elif self.dca_config_raw:
 			# Parse custom DCA configuration
@@ -3,7 +3,6 @@
 from textual.app import App
 from textual.binding import Binding
 from ui.screens.setup import SetupScreen
-from ui.screens.trading import TradingScreen
 import os
 
 
@@ -30,6 +29,10 @@ class CryptoTradingApp(App):
         Args:
             config: Configuration dictionary from setup screen
         """
+        # Imported here so the trading engine (and its sqlite/exchange
+        # dependencies) only load once the user actually starts trading
+        from ui.screens.trading import TradingScreen
+
         # Pop setup screen and push trading screen
         self.pop_screen()
         self.push_screen(TradingScreen(config))
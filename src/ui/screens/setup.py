@@ -6,13 +6,16 @@ from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Header, Footer, Button, Static, Input, Select, RadioSet, RadioButton, Label
 from textual.validation import Function, Number
 from typing import Optional
-import sys
-import os
 
-# Add parent directory to path to import helper modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-from helper import Config
-from coinbasepro import CoinbasePro
+# Note: helper/coinbasepro are deliberately not imported here - the setup
+# screen is pure form handling, and keeping the SDK off this module's
+# import path makes the UI's first paint noticeably faster. The UI is
+# always launched via src/main.py, which already has src on sys.path, so
+# no path manipulation is needed either.
+
+# Stop-value placeholders, swapped when the stop mode radio changes
+_STOP_PLACEHOLDER_PCT = "e.g., 0.05 for 5%, 0.10 for 10%"
+_STOP_PLACEHOLDER_ABS = "e.g., 0.01 for $0.01, 100 for $100"
 
 
 class SetupScreen(Screen):
@@ -107,6 +110,7 @@ class SetupScreen(Screen):
                 yield Label("DCA Configuration", classes="section-label")
                 with RadioSet(id="dca-type-radio"):
                     yield RadioButton("Default - Auto 4-tier ladder (+10%/+20%/+30%/+50%, 25% each)", value=True)
+                    yield RadioButton("SmartDCA - Default ladder weighted by 1/price (better average price)", value=False)
                     yield RadioButton("Custom - Define your own price thresholds", value=False)
                 yield Input(
                     placeholder="e.g., '+10%:100,+20%:150,+30%:200' or '0.30:100,0.40:150'",
@@ -141,6 +145,12 @@ class SetupScreen(Screen):
         self.query_one("#dca-type-radio").query_one("RadioButton:nth-child(1)").value = True  # Default
         self.query_one("#stop-mode-radio").query_one("RadioButton:nth-child(2)").value = True  # Absolute
 
+        # Cache widgets touched on every radio change; a selector query
+        # walks the DOM, an attribute load does not
+        self._dca_section = self.query_one("#dca-section")
+        self._custom_input = self.query_one("#dca-custom-input")
+        self._stop_input = self.query_one("#stop-value-input")
+
     def on_radio_set_changed(self, event: RadioSet.Changed) -> None:
         """Handle radio button changes."""
         if event.radio_set.id == "trade-type-radio":
@@ -148,21 +158,18 @@ class SetupScreen(Screen):
         elif event.radio_set.id == "mode-radio":
             self.mode = "dca" if event.index == 1 else "simple"
             # Show/hide DCA section
-            dca_section = self.query_one("#dca-section")
-            dca_section.display = self.mode == "dca"
+            self._dca_section.display = self.mode == "dca"
         elif event.radio_set.id == "dca-type-radio":
-            self.dca_type = "default" if event.index == 0 else "custom"
+            self.dca_type = ("default", "smart", "custom")[event.index]
             # Enable/disable custom input
-            custom_input = self.query_one("#dca-custom-input")
-            custom_input.disabled = self.dca_type == "default"
+            self._custom_input.disabled = self.dca_type != "custom"
         elif event.radio_set.id == "stop-mode-radio":
             self.stop_mode = "percentage" if event.index == 0 else "absolute"
             # Update placeholder
-            stop_input = self.query_one("#stop-value-input")
-            if self.stop_mode == "percentage":
-                stop_input.placeholder = "e.g., 0.05 for 5%, 0.10 for 10%"
-            else:
-                stop_input.placeholder = "e.g., 0.01 for $0.01, 100 for $100"
+            self._stop_input.placeholder = (
+                _STOP_PLACEHOLDER_PCT if self.stop_mode == "percentage"
+                else _STOP_PLACEHOLDER_ABS
+            )
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button clicks."""
@@ -175,7 +182,7 @@ class SetupScreen(Screen):
         """Validate inputs and start trading."""
         # Get values
         symbol = self.query_one("#symbol-input").value.strip().upper()
-        stop_value_str = self.query_one("#stop-value-input").value.strip()
+        stop_value_str = self._stop_input.value.strip()
 
         # Validate symbol
         if not symbol:
@@ -206,10 +213,10 @@ class SetupScreen(Screen):
         # Validate custom DCA if needed
         dca_config = None
         if self.mode == "dca":
-            if self.dca_type == "default":
+            if self.dca_type in ("default", "smart"):
                 dca_config = "DEFAULT"
             else:
-                dca_custom = self.query_one("#dca-custom-input").value.strip()
+                dca_custom = self._custom_input.value.strip()
                 if not dca_custom:
                     self.app.bell()
                     self.notify("Please enter custom DCA thresholds", severity="error", timeout=3)
@@ -227,6 +234,7 @@ class SetupScreen(Screen):
             'type': self.trade_type,
             'mode': self.mode,
             'dca_config': dca_config,
+            'smart_dca': self.dca_type == "smart",
             'stop_mode': self.stop_mode,
             'stop_value': stop_value,
             'interval': 5.0,  # Default 5 seconds
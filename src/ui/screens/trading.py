@@ -6,18 +6,22 @@ from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Header, Footer, Static
 from textual.reactive import reactive
 from datetime import datetime
+import queue
 import threading
-import sys
-import os
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from ui.widgets.price_chart import PriceChart
 from ui.widgets.stats_panel import StatsPanel
 from ui.widgets.threshold_tracker import ThresholdTracker
 from ui.widgets.event_log import EventLog
-from trail import StopTrail
+
+# The UI is always launched via src/main.py, which puts src on sys.path,
+# so no path manipulation is needed. StopTrail is imported lazily in
+# start_trading_bot: it drags in the exchange SDK and sqlite setup, which
+# the screen shouldn't pay for at import time.
+
+# Prepared once; sqlite3 caches the compiled statement per connection
+# when the SQL string object is reused
+_THRESHOLD_QUERY = "SELECT price, amount, threshold_hit FROM thresholds WHERE symbol = ? ORDER BY price"
 
 
 class TradingScreen(Screen):
@@ -79,9 +83,16 @@ class TradingScreen(Screen):
     def __init__(self, config: dict):
         super().__init__()
         self.config = config
-        self.bot: StopTrail = None
+        self.bot = None  # StopTrail, created in start_trading_bot
         self.bot_thread: threading.Thread = None
         self.running = False
+        # Latest unrendered price update; price_update events are coalesced
+        # and flushed at a bounded rate (see _flush_ui) so a fast polling
+        # interval can't flood the UI thread with redundant chart replots
+        self._pending_price: dict = None
+        # Bot events land here from the bot thread; the UI drains on a
+        # timer instead of paying a call_from_thread wakeup per event
+        self._event_queue = queue.SimpleQueue()
 
     def compose(self) -> ComposeResult:
         """Create the trading dashboard widgets."""
@@ -113,21 +124,35 @@ class TradingScreen(Screen):
 
     def on_mount(self) -> None:
         """Initialize the trading bot when screen mounts."""
+        # Resolve the dashboard widgets once; every bot event used to pay
+        # a query_one tree walk per widget it touched
+        self._chart = self.query_one(PriceChart)
+        self._stats = self.query_one(StatsPanel)
+        self._log = self.query_one(EventLog)
+        self._tracker = self.query_one(ThresholdTracker) if self.config['mode'] == 'dca' else None
+
         self.log_event("Initializing trading bot...")
 
         # Initialize stats panel
-        stats_panel = self.query_one(StatsPanel)
-        stats_panel.update_stats(
+        self._stats.update_stats(
             mode=self.config['type'],
             symbol=self.config['symbol'],
             trailing_distance=f"${self.config['stop_value']:.4f} {self.config['stop_mode']}"
         )
 
+        # Drain queued bot events at 20 Hz and flush coalesced price
+        # updates at ~15 Hz; bursts of bot events between ticks collapse
+        # into a single chart/stats repaint
+        self.set_interval(0.05, self._drain_events)
+        self.set_interval(1 / 15, self._flush_ui)
+
         # Start the trading bot in a separate thread
         self.start_trading_bot()
 
     def start_trading_bot(self):
         """Start the trading bot with UI callbacks."""
+        from trail import StopTrail
+
         try:
             # Create bot instance with UI callback
             self.bot = StopTrail(
@@ -139,6 +164,7 @@ class TradingScreen(Screen):
                 simple_mode=(self.config['mode'] == 'simple'),
                 dca_config=self.config.get('dca_config'),
                 stop_mode=self.config['stop_mode'],
+                smart_dca=self.config.get('smart_dca', False),
                 ui_callback=self.handle_bot_event
             )
 
@@ -166,29 +192,57 @@ class TradingScreen(Screen):
     def initialize_threshold_tracker(self):
         """Initialize the threshold tracker with DCA thresholds."""
         try:
-            tracker = self.query_one(ThresholdTracker)
+            tracker = self._tracker
 
-            # Fetch thresholds from database
+            # Fetch thresholds from database; the index on
+            # (symbol, threshold_hit) covers this lookup. Iterating the
+            # cursor directly avoids materializing an intermediate row list
             cursor = self.bot.con.cursor()
-            cursor.execute(
-                "SELECT price, amount, threshold_hit FROM thresholds WHERE symbol = ? ORDER BY price",
-                (self.bot.market,)
-            )
-            rows = cursor.fetchall()
+            cursor.execute(_THRESHOLD_QUERY, (self.bot.market,))
+            thresholds = [(price, amount, hit == 'Y') for price, amount, hit in cursor]
             cursor.close()
 
-            thresholds = [(row[2], row[3], row[4] == 'Y') for row in rows]
             tracker.set_thresholds(thresholds, self.config['symbol'])
 
         except Exception as e:
             self.log_event(f"Failed to load thresholds: {str(e)}", "error")
 
     def handle_bot_event(self, event_type: str, data: dict):
-        """Handle events from the trading bot."""
-        # Use call_from_thread to safely update UI from bot thread
-        self.call_from_thread(self.process_bot_event, event_type, data)
-
-    def process_bot_event(self, event_type: str, data: dict):
+        """Handle events from the trading bot (called on the bot thread)."""
+        # Just enqueue; the drain timer dispatches on the UI thread
+        self._event_queue.put_nowait((event_type, data))
+
+    def _drain_events(self):
+        """Dispatch queued bot events on the UI thread.
+
+        Repeated price/balance updates are coalesced to the most recent
+        one per drain; discrete events (trades, threshold hits, stop
+        moves, log lines) are dispatched individually in arrival order.
+        """
+        latest = {}
+        discrete = []
+        while True:
+            try:
+                event_type, data = self._event_queue.get_nowait()
+            except queue.Empty:
+                break
+            if event_type in ('price_update', 'balance_update'):
+                latest[event_type] = data
+            else:
+                discrete.append((event_type, data))
+
+        if not (discrete or latest):
+            return
+
+        # One clock read for the whole drain; every event in this batch
+        # shares the same timestamp
+        now = datetime.now()
+        for event_type, data in discrete:
+            self.process_bot_event(event_type, data, now)
+        for event_type, data in latest.items():
+            self.process_bot_event(event_type, data, now)
+
+    def process_bot_event(self, event_type: str, data: dict, now: datetime = None):
         """Process bot events (called on main thread)."""
         try:
             if event_type == "price_update":
@@ -205,23 +259,32 @@ class TradingScreen(Screen):
                 self.log_event(data.get('message', ''), data.get('level', 'info'))
 
             # Update last update time
-            self.last_update_time = datetime.now()
+            self.last_update_time = now if now is not None else datetime.now()
 
         except Exception as e:
             self.log_event(f"Error processing event: {str(e)}", "error")
 
     def handle_price_update(self, data: dict):
-        """Handle price update event."""
+        """Record a price update for the next UI flush."""
+        # Only the latest tick matters for the chart and stats; stash it
+        # and let _flush_ui render at its own cadence
+        self._pending_price = data
+
+    def _flush_ui(self):
+        """Render the most recent pending price update, if any."""
+        data, self._pending_price = self._pending_price, None
+        if data is None:
+            return
+
         price = data.get('price')
         stop_loss = data.get('stop_loss')
 
-        # Update chart
-        chart = self.query_one(PriceChart)
-        chart.add_data_point(price, stop_loss)
+        # Update chart; reuse the timestamp stamped when the event was
+        # drained so the chart doesn't read the clock again
+        self._chart.add_data_point(price, stop_loss, timestamp=self.last_update_time)
 
         # Update stats
-        stats = self.query_one(StatsPanel)
-        stats.update_stats(
+        self._stats.update_stats(
             price=price,
             stop_loss=stop_loss,
             stop_initialized=data.get('stop_initialized', False),
@@ -230,52 +293,39 @@ class TradingScreen(Screen):
         )
 
         # Update threshold tracker if DCA mode
-        if self.config['mode'] == 'dca':
-            try:
-                tracker = self.query_one(ThresholdTracker)
-                tracker.update_price(price)
-            except:
-                pass  # Tracker might not exist
+        if self._tracker is not None:
+            self._tracker.update_price(price)
 
     def handle_stop_update(self, data: dict):
         """Handle stop loss update event."""
         stop_loss = data.get('stop_loss')
         direction = data.get('direction', 'updated')
 
-        event_log = self.query_one(EventLog)
-        event_log.log_stop_update(stop_loss, direction)
+        self._log.log_stop_update(stop_loss, direction)
 
         # Update stats
-        stats = self.query_one(StatsPanel)
-        stats.update_stats(stop_loss=stop_loss, stop_initialized=True)
+        self._stats.update_stats(stop_loss=stop_loss, stop_initialized=True)
 
     def handle_threshold_hit(self, data: dict):
         """Handle DCA threshold hit event."""
         threshold = data.get('threshold')
         amount = data.get('amount')
 
-        event_log = self.query_one(EventLog)
-        event_log.log_threshold_hit(threshold, amount, self.config['symbol'])
+        self._log.log_threshold_hit(threshold, amount, self.config['symbol'])
 
         # Update threshold tracker
-        if self.config['mode'] == 'dca':
-            try:
-                tracker = self.query_one(ThresholdTracker)
-                tracker.mark_threshold_hit(threshold)
-            except:
-                pass
+        if self._tracker is not None:
+            self._tracker.mark_threshold_hit(threshold)
 
     def handle_balance_update(self, data: dict):
         """Handle balance update event."""
         amount = data.get('amount')
         action = data.get('action', 'updated')
 
-        event_log = self.query_one(EventLog)
-        event_log.log_balance_update(amount, action)
+        self._log.log_balance_update(amount, action)
 
         # Update stats
-        stats = self.query_one(StatsPanel)
-        stats.update_stats(balance=data.get('balance'), hopper=data.get('hopper'))
+        self._stats.update_stats(balance=data.get('balance'), hopper=data.get('hopper'))
 
     def handle_trade_executed(self, data: dict):
         """Handle trade execution event."""
@@ -283,13 +333,11 @@ class TradingScreen(Screen):
         amount = data.get('amount')
         price = data.get('price')
 
-        event_log = self.query_one(EventLog)
-        event_log.log_trade_executed(trade_type, amount, price, self.config['symbol'])
+        self._log.log_trade_executed(trade_type, amount, price, self.config['symbol'])
 
     def log_event(self, message: str, level: str = "info"):
         """Log an event to the event log."""
-        event_log = self.query_one(EventLog)
-        event_log.log_event(message, level)
+        self._log.log_event(message, level)
 
     def action_quit(self) -> None:
         """Quit the application."""
@@ -8,6 +8,16 @@ from collections import deque
 class EventLog(RichLog):
     """Scrolling log of trading events with color coding."""
 
+    # Complete markup template per log level; one format() call renders a
+    # line instead of assembling prefix and color separately
+    _TEMPLATES = {
+        "success": "[dim]{ts}[/dim] [bold green]✓[/bold green] [green]{msg}[/green]",
+        "warning": "[dim]{ts}[/dim] [bold yellow]⚠[/bold yellow] [yellow]{msg}[/yellow]",
+        "error": "[dim]{ts}[/dim] [bold red]✗[/bold red] [red]{msg}[/red]",
+        "trade": "[dim]{ts}[/dim] [bold cyan]💰[/bold cyan] [cyan]{msg}[/cyan]",
+        "info": "[dim]{ts}[/dim] [bold blue]ℹ[/bold blue] [white]{msg}[/white]",
+    }
+
     def __init__(self, max_lines: int = 100):
         super().__init__(
             highlight=True,
@@ -16,6 +26,33 @@ class EventLog(RichLog):
             wrap=True,
         )
         self.auto_scroll = True
+        # Lines wait here until the flush timer drains them, so a burst of
+        # events costs one RichLog.write (one re-layout) instead of many
+        self._buffer: deque = deque()
+        # Formatted "HH:MM:SS" cached per absolute wall-clock second
+        self._last_ts_sec: int = -1
+        self._last_ts_str: str = ""
+
+    def on_mount(self):
+        """Start the buffered-write flush timer."""
+        self.set_interval(0.1, self._flush)
+
+    def _flush(self):
+        """Write all buffered lines in a single RichLog update."""
+        if self._buffer:
+            self.write("\n".join(self._buffer))
+            self._buffer.clear()
+
+    def _timestamp(self) -> str:
+        """Return "HH:MM:SS" for now, reformatted at most once per second."""
+        now = datetime.now()
+        # Key on the epoch second, not second-of-minute: events landing on
+        # the same second-of-minute minutes apart must not reuse the stamp
+        sec = int(now.timestamp())
+        if sec != self._last_ts_sec:
+            self._last_ts_sec = sec
+            self._last_ts_str = now.strftime("%H:%M:%S")
+        return self._last_ts_str
 
     def log_event(self, message: str, level: str = "info"):
         """Log an event with timestamp and color coding.
@@ -24,27 +61,8 @@ class EventLog(RichLog):
             message: The message to log
             level: Log level (info, success, warning, error)
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
-        # Color code based on level
-        if level == "success":
-            prefix = "[bold green]✓[/bold green]"
-            color = "green"
-        elif level == "warning":
-            prefix = "[bold yellow]⚠[/bold yellow]"
-            color = "yellow"
-        elif level == "error":
-            prefix = "[bold red]✗[/bold red]"
-            color = "red"
-        elif level == "trade":
-            prefix = "[bold cyan]💰[/bold cyan]"
-            color = "cyan"
-        else:  # info
-            prefix = "[bold blue]ℹ[/bold blue]"
-            color = "white"
-
-        formatted_message = f"[dim]{timestamp}[/dim] {prefix} [{color}]{message}[/{color}]"
-        self.write(formatted_message)
+        template = self._TEMPLATES.get(level, self._TEMPLATES["info"])
+        self._buffer.append(template.format(ts=self._timestamp(), msg=message))
 
     def log_price_update(self, price: float):
         """Log a price update."""
@@ -6,6 +6,11 @@ from collections import deque
 from typing import Optional, List, Tuple
 from datetime import datetime
 
+import numpy as np
+
+# Sparkline glyphs for the ASCII fallback chart, lowest to highest
+_BARS = (' ', '▁', '▂', '▃', '▄', '▅', '▆', '▇', '█')
+
 
 class PriceChart(PlotextPlot):
     """Interactive price chart showing price history and stop loss."""
@@ -13,74 +18,185 @@ class PriceChart(PlotextPlot):
     def __init__(self, max_points: int = 100):
         super().__init__()
         self.max_points = max_points
-        self.price_history: deque = deque(maxlen=max_points)
-        self.stop_history: deque = deque(maxlen=max_points)
+        # Preallocated ring buffers; NaN in the stop array means "no stop
+        # yet". float64 rather than float32: four-decimal prices above a
+        # few thousand dollars already exceed float32's ~7 significant
+        # digits. min/max and the NaN mask run as NumPy C loops instead of
+        # boxed-float iteration
+        self._prices = np.empty(max_points, dtype=np.float64)
+        self._stops = np.empty(max_points, dtype=np.float64)
+        self._n = 0      # valid entries
+        self._head = 0   # next write slot
         self.timestamps: deque = deque(maxlen=max_points)
+        # Render bookkeeping: skip redraws when no point was added, and
+        # keep the last padded y-axis band so limits are only recomputed
+        # when a new value escapes it
+        self._total = 0
+        self._last_total = 0
+        # Set on append, consumed by the redraw timer; caps plotext work
+        # at the timer rate no matter how fast points arrive
+        self._dirty = False
+        self._ylim_lo: Optional[float] = None
+        self._ylim_hi: Optional[float] = None
+        # Running extremes over both series, maintained on append so the
+        # y-limit check never has to rescan the deques
+        self._running_min: Optional[float] = None
+        self._running_max: Optional[float] = None
+        # Number of non-None entries in stop_history; missing stops are
+        # stored as None rather than a synthetic price*0.95 point
+        self._stop_count = 0
+
+    def on_mount(self) -> None:
+        """Apply the static figure styling once and start the redraw timer."""
+        self._apply_styling()
+        # Appends only mark the chart dirty; this timer bounds the actual
+        # plotext redraw at 10 Hz regardless of the bot's tick rate
+        self.set_interval(1 / 10, self._maybe_redraw)
+
+    def _maybe_redraw(self):
+        """Redraw the chart if new data arrived since the last frame."""
+        if self._dirty:
+            self._dirty = False
+            self.update_chart()
+
+    def _apply_styling(self):
+        """Set title, labels and grid on the figure.
+
+        clear_data() preserves these settings, so they are applied once at
+        mount (and again after a full clear_figure) rather than per tick.
+        """
+        plt = self.plt
+        plt.title("Price Movement")
+        plt.xlabel("Time")
+        plt.ylabel("Price ($)")
+        plt.grid(True, True)
 
     def add_data_point(self, price: float, stop_loss: Optional[float] = None, timestamp: Optional[datetime] = None):
         """Add a new data point to the chart."""
-        self.price_history.append(price)
-        self.stop_history.append(stop_loss if stop_loss is not None else price * 0.95)  # Default fallback
+        # Peek the slot about to be overwritten on a full ring; if it held
+        # an extremum, the running min/max must be rescanned
+        evicted = None
+        if self._n == self.max_points:
+            evicted = (self._prices[self._head], self._stops[self._head])
+            if not np.isnan(evicted[1]):
+                self._stop_count -= 1
+
+        self._prices[self._head] = price
+        self._stops[self._head] = stop_loss if stop_loss is not None else np.nan
+        self._head = (self._head + 1) % self.max_points
+        self._n = min(self._n + 1, self.max_points)
+        self._total += 1
         self.timestamps.append(timestamp or datetime.now())
-        self.update_chart()
+        if stop_loss is not None:
+            self._stop_count += 1
+
+        if evicted is not None and (
+            self._running_min in evicted or self._running_max in evicted
+        ):
+            # Rare: the evicted edge was the extremum, rescan once
+            self._rescan_extremes()
+        else:
+            lo = hi = price
+            if stop_loss is not None:
+                lo, hi = min(price, stop_loss), max(price, stop_loss)
+            if self._running_min is None or lo < self._running_min:
+                self._running_min = lo
+            if self._running_max is None or hi > self._running_max:
+                self._running_max = hi
+
+        self._dirty = True
+
+    def _view(self, arr: np.ndarray) -> np.ndarray:
+        """Return the buffer contents in insertion order."""
+        if self._n < self.max_points:
+            return arr[:self._n]
+        # Full ring: unroll once around the head
+        return np.concatenate((arr[self._head:], arr[:self._head]))
+
+    def _rescan_extremes(self):
+        """Recompute running min/max over prices and real stop values."""
+        prices = self._prices[:self._n]
+        self._running_min = prices.min()
+        self._running_max = prices.max()
+        if self._stop_count:
+            stops = self._stops[:self._n]
+            stops = stops[~np.isnan(stops)]
+            self._running_min = min(self._running_min, stops.min())
+            self._running_max = max(self._running_max, stops.max())
 
     def update_chart(self):
         """Refresh the chart with current data."""
-        if len(self.price_history) == 0:
+        n = self._n
+        if n == 0 or self._total == self._last_total:
+            # Nothing new to draw
             return
+        self._last_total = self._total
 
         plt = self.plt
         plt.clear_data()
-        plt.clear_figure()
 
         # Create x-axis (simple indices for now)
-        x_vals = list(range(len(self.price_history)))
+        x_vals = list(range(n))
 
         # Plot price line
         plt.plot(
             x_vals,
-            list(self.price_history),
+            self._view(self._prices).tolist(),
             label="Price",
             color="green",
             marker="dot"
         )
 
-        # Plot stop loss line
-        valid_stops = [s for s in self.stop_history if s is not None]
-        if valid_stops:
+        # Plot stop loss line only where real stop values exist; once the
+        # stop initializes every point is real and the fast path applies
+        if self._stop_count == n:
             plt.plot(
                 x_vals,
-                list(self.stop_history),
+                self._view(self._stops).tolist(),
+                label="Stop Loss",
+                color="red",
+                marker="dot"
+            )
+        elif self._stop_count:
+            stops = self._view(self._stops)
+            mask = ~np.isnan(stops)
+            plt.plot(
+                np.nonzero(mask)[0].tolist(),
+                stops[mask].tolist(),
                 label="Stop Loss",
                 color="red",
                 marker="dot"
             )
 
-        # Styling
-        plt.title("Price Movement")
-        plt.xlabel("Time")
-        plt.ylabel("Price ($)")
-
-        # Set y-axis limits with some padding
-        if self.price_history:
-            min_val = min(min(self.price_history), min(self.stop_history))
-            max_val = max(max(self.price_history), max(self.stop_history))
+        # Recompute y-axis limits only when a value escapes the cached
+        # padded band; oscillation inside the band reuses the old limits
+        min_val = self._running_min
+        max_val = self._running_max
+        if self._ylim_lo is None or min_val < self._ylim_lo or max_val > self._ylim_hi:
             padding = (max_val - min_val) * 0.1
-            plt.ylim(min_val - padding, max_val + padding)
-
-        # Grid
-        plt.grid(True, True)
+            self._ylim_lo = min_val - padding
+            self._ylim_hi = max_val + padding
+            plt.ylim(self._ylim_lo, self._ylim_hi)
 
         self.refresh()
 
     def clear_chart(self):
         """Clear all data from the chart."""
-        self.price_history.clear()
-        self.stop_history.clear()
+        self._n = 0
+        self._head = 0
+        self._total = 0
+        self._last_total = 0
+        self._dirty = False
         self.timestamps.clear()
+        self._ylim_lo = None
+        self._ylim_hi = None
+        self._running_min = None
+        self._running_max = None
+        self._stop_count = 0
         if hasattr(self, 'plt'):
             self.plt.clear_data()
             self.plt.clear_figure()
+            self._apply_styling()
             self.refresh()
 
 
@@ -90,10 +206,26 @@ class StaticPriceChart(Static):
     def __init__(self):
         super().__init__()
         self.price_history: deque = deque(maxlen=50)
+        self._running_min: Optional[float] = None
+        self._running_max: Optional[float] = None
 
     def add_data_point(self, price: float, stop_loss: Optional[float] = None, timestamp: Optional[datetime] = None):
         """Add a new price point."""
+        evicted = None
+        if len(self.price_history) == self.price_history.maxlen:
+            evicted = self.price_history[0]
+
         self.price_history.append(price)
+
+        if evicted is not None and evicted in (self._running_min, self._running_max):
+            self._running_min = min(self.price_history)
+            self._running_max = max(self.price_history)
+        else:
+            if self._running_min is None or price < self._running_min:
+                self._running_min = price
+            if self._running_max is None or price > self._running_max:
+                self._running_max = price
+
         self.render_ascii_chart()
 
     def render_ascii_chart(self):
@@ -103,17 +235,15 @@ class StaticPriceChart(Static):
             return
 
         # Simple ASCII sparkline
-        min_price = min(self.price_history)
-        max_price = max(self.price_history)
+        min_price = self._running_min
+        max_price = self._running_max
         price_range = max_price - min_price if max_price > min_price else 1
 
         sparkline = ""
-        bars = [' ', '▁', '▂', '▃', '▄', '▅', '▆', '▇', '█']
-
         for price in self.price_history:
             normalized = (price - min_price) / price_range
-            index = int(normalized * (len(bars) - 1))
-            sparkline += bars[index]
+            index = int(normalized * (len(_BARS) - 1))
+            sparkline += _BARS[index]
 
         chart_text = f"""
 Price Chart
@@ -8,6 +8,10 @@ from typing import Optional
 class StatsPanel(Vertical):
     """Panel displaying current trading statistics."""
 
+    # Static chunks of the stats markup, built once instead of per render
+    _HEADER = "[bold cyan]STATS[/bold cyan]\n━━━━━━━━━━━━━━━━━━━\n"
+    _FOOTER = "\n━━━━━━━━━━━━━━━━━━━"
+
     def __init__(self):
         super().__init__(classes="stats-container")
         self.current_price: Optional[float] = None
@@ -19,10 +23,50 @@ class StatsPanel(Vertical):
         self.mode: str = "sell"
         self.symbol: str = ""
         self.win_rate: Optional[str] = None
+        # Parsed once when the symbol is set; it never changes mid-session
+        self._base_currency: str = "COIN"
+        self._quote_currency: str = "USD"
+        # Per-field widgets and their last-pushed content; render_stats
+        # only updates the widgets whose text actually changed, so Textual
+        # repaints just the dirtied regions
+        self._fields: dict = {}
+        self._last_rendered: dict = {}
 
     def compose(self):
-        """Create the stats display."""
-        yield Static("", id="stats-content")
+        """Create the stats display as one Static per field."""
+        yield Static(self._HEADER, id="stats-header")
+        yield Static("\n[bold]Current Price[/bold]", id="price-label")
+        yield Static("", id="price-value")
+        yield Static("\n[bold]Stop Loss[/bold]", id="stop-label")
+        yield Static("", id="stop-value")
+        yield Static("\n[bold]Trailing Distance[/bold]", id="distance-label")
+        yield Static("", id="distance-value")
+        yield Static("\n[bold]Balance[/bold]", id="balance-label")
+        yield Static("", id="balance-value")
+        yield Static("\n[bold]Hopper (Ready)[/bold]", id="hopper-label")
+        yield Static("", id="hopper-value")
+        yield Static("\n[bold]Win Rate[/bold]", id="winrate-label")
+        yield Static("", id="winrate-value")
+        yield Static(self._FOOTER, id="stats-footer")
+
+    def on_mount(self):
+        """Cache the per-field widgets and hide the optional win-rate row."""
+        for field_id in (
+            "price-value", "stop-value", "distance-value",
+            "balance-label", "balance-value",
+            "hopper-label", "hopper-value",
+            "winrate-label", "winrate-value",
+        ):
+            self._fields[field_id] = self.query_one(f"#{field_id}")
+        self._fields["winrate-label"].display = False
+        self._fields["winrate-value"].display = False
+        self.render_stats()
+
+    def _set_field(self, field_id: str, text: str):
+        """Push text to a field widget only if it changed since last render."""
+        if self._last_rendered.get(field_id) != text:
+            self._last_rendered[field_id] = text
+            self._fields[field_id].update(text)
 
     def update_stats(
         self,
@@ -53,15 +97,19 @@ class StatsPanel(Vertical):
             self.mode = mode
         if symbol is not None:
             self.symbol = symbol
+            if "/" in symbol:
+                self._base_currency, self._quote_currency = symbol.split("/", 1)
         if win_rate is not None:
             self.win_rate = win_rate
 
-        self.render_stats()
+        # Before mount there are no field widgets yet; on_mount renders
+        # whatever state has accumulated by then
+        if self._fields:
+            self.render_stats()
 
     def render_stats(self):
         """Render the stats display."""
-        base_currency = self.symbol.split("/")[0] if "/" in self.symbol else "COIN"
-        quote_currency = self.symbol.split("/")[1] if "/" in self.symbol else "USD"
+        base_currency = self._base_currency
 
         # Determine stop loss status indicator
         if self.stop_initialized and self.stop_loss is not None and self.current_price is not None:
@@ -75,43 +123,32 @@ class StatsPanel(Vertical):
         else:
             status_indicator = "⏸"  # Not initialized
 
-        content = f"""[bold cyan]STATS[/bold cyan]
-━━━━━━━━━━━━━━━━━━━
-
-[bold]Current Price[/bold]
-[bold green]${self.current_price:.4f if self.current_price else 0}[/bold green]
+        # Format each value up front: a conditional inside a format spec is
+        # not valid Python, so the old f-strings raised ValueError on every
+        # numeric tick and nothing rendered
+        price_str = f"{self.current_price:.4f}" if self.current_price is not None else "0.0000"
+        stop_str = f"{self.stop_loss:.4f}" if self.stop_loss is not None else "0.0000"
 
-[bold]Stop Loss[/bold]
-${self.stop_loss:.4f if self.stop_loss else 0}  {status_indicator}
-
-[bold]Trailing Distance[/bold]
-{self.trailing_distance}
-"""
+        self._set_field("price-value", f"[bold green]${price_str}[/bold green]")
+        self._set_field("stop-value", f"${stop_str}  {status_indicator}")
+        self._set_field("distance-value", self.trailing_distance)
 
         if self.mode == "sell":
-            content += f"""
-[bold]Balance[/bold]
-{self.balance:.4f if self.balance else 0} {base_currency}
-
-[bold]Hopper (Ready)[/bold]
-{self.hopper:.4f if self.hopper else 0} {base_currency}
-"""
+            balance_str = f"{self.balance:.4f}" if self.balance is not None else "0.0000"
+            hopper_str = f"{self.hopper:.4f}" if self.hopper is not None else "0.0000"
+            self._set_field("balance-label", "\n[bold]Balance[/bold]")
+            self._set_field("balance-value", f"{balance_str} {base_currency}")
+            self._set_field("hopper-label", "\n[bold]Hopper (Ready)[/bold]")
+            self._set_field("hopper-value", f"{hopper_str} {base_currency}")
         else:  # buy mode
-            content += f"""
-[bold]Balance[/bold]
-${self.balance:.2f if self.balance else 0}
-
-[bold]Available[/bold]
-${self.hopper:.2f if self.hopper else 0}
-"""
+            balance_str = f"{self.balance:.2f}" if self.balance is not None else "0.00"
+            hopper_str = f"{self.hopper:.2f}" if self.hopper is not None else "0.00"
+            self._set_field("balance-label", "\n[bold]Balance[/bold]")
+            self._set_field("balance-value", f"${balance_str}")
+            self._set_field("hopper-label", "\n[bold]Available[/bold]")
+            self._set_field("hopper-value", f"${hopper_str}")
 
         if self.win_rate:
-            content += f"""
-[bold]Win Rate[/bold]
-{self.win_rate}
-"""
-
-        content += "\n━━━━━━━━━━━━━━━━━━━"
-
-        stats_widget = self.query_one("#stats-content")
-        stats_widget.update(content)
+            self._fields["winrate-label"].display = True
+            self._fields["winrate-value"].display = True
+            self._set_field("winrate-value", self.win_rate)
@@ -10,9 +10,23 @@ class ThresholdTracker(Vertical):
 
     def __init__(self):
         super().__init__(classes="thresholds-container")
-        self.thresholds: List[Tuple[float, float, bool]] = []  # (price, amount, hit)
+        # [price, amount, hit] lists so the hit flag can be set in place
+        self.thresholds: List[list] = []
         self.current_price: float = 0
         self.symbol: str = ""
+        # Parsed once in set_thresholds; the symbol is fixed per session
+        self._base_currency: str = "COIN"
+        # rounded price -> index, so mark_threshold_hit is a dict lookup
+        self._price_index: dict = {}
+        # Render memoization: skip work when no visible row could change.
+        # Keyed on the per-row (progress, hit) states so it tracks what is
+        # actually displayed, at any price scale
+        self._last_state: tuple = ()
+        self._last_content: Optional[str] = None
+        # Formatted rows keyed by (index, hit, progress); a row's text is
+        # fully determined by those, so oscillating prices mostly re-join
+        # cached strings instead of re-formatting
+        self._row_cache: dict = {}
 
     def compose(self):
         """Create the threshold display."""
@@ -21,21 +35,49 @@ class ThresholdTracker(Vertical):
 
     def set_thresholds(self, thresholds: List[Tuple[float, float, bool]], symbol: str):
         """Set the threshold data."""
-        self.thresholds = thresholds
+        self.thresholds = [list(t) for t in thresholds]
+        self._price_index = {round(price, 4): i for i, (price, _, _) in enumerate(thresholds)}
+        self._row_cache.clear()
         self.symbol = symbol
+        if "/" in symbol:
+            self._base_currency = symbol.split("/", 1)[0]
         self.render_thresholds()
 
+    def _row_progress(self, price: float, hit: bool) -> int:
+        """Progress percentage shown for one threshold row."""
+        if hit:
+            return 100
+        if self.current_price >= price * 0.95:  # Within 5% of threshold
+            progress = int((self.current_price / price) * 100)
+            return min(progress, 99)  # Cap at 99% until actually hit
+        return 0
+
     def update_price(self, price: float):
         """Update current price and re-render."""
         self.current_price = price
+
+        # Only re-render when some row's displayed (progress, hit) state
+        # changed; this is exact regardless of the asset's price scale
+        state = tuple((self._row_progress(p, h), h) for p, _, h in self.thresholds)
+        if state == self._last_state:
+            return
+        self._last_state = state
+
         self.render_thresholds()
 
     def mark_threshold_hit(self, threshold_price: float):
         """Mark a threshold as hit."""
-        for i, (price, amount, hit) in enumerate(self.thresholds):
-            if abs(price - threshold_price) < 0.01:  # Close enough
-                self.thresholds[i] = (price, amount, True)
-                break
+        idx = self._price_index.get(round(threshold_price, 4))
+        if idx is None:
+            # Bot-reported price didn't round-trip exactly; fall back to
+            # the tolerance scan
+            idx = next(
+                (i for i, (price, _, _) in enumerate(self.thresholds)
+                 if abs(price - threshold_price) < 0.01),
+                None
+            )
+        if idx is not None:
+            self.thresholds[idx][2] = True
         self.render_thresholds()
 
     def render_thresholds(self):
@@ -43,27 +85,36 @@ class ThresholdTracker(Vertical):
         if not self.thresholds:
             content = "\n[dim]No thresholds configured[/dim]"
         else:
-            base_currency = self.symbol.split("/")[0] if "/" in self.symbol else "COIN"
+            base_currency = self._base_currency
             content = "\n"
 
-            for price, amount, hit in self.thresholds:
-                # Calculate progress percentage
-                if hit:
-                    progress = 100
-                    status = "✅"
-                    bar = "█" * 12
-                elif self.current_price >= price * 0.95:  # Within 5% of threshold
-                    progress = int((self.current_price / price) * 100)
-                    progress = min(progress, 99)  # Cap at 99% until actually hit
-                    status = "🎯"
-                    filled = int(progress / 100 * 12)
-                    bar = "█" * filled + "░" * (12 - filled)
-                else:
-                    progress = 0
-                    status = "⏸"
-                    bar = "░" * 12
-
-                content += f"{status} [bold]${price:.4f}[/bold]  {amount:.2f} {base_currency}  [{bar}] {progress}%\n"
+            for i, (price, amount, hit) in enumerate(self.thresholds):
+                progress = self._row_progress(price, hit)
+
+                # A row's text depends only on its index, hit flag and
+                # progress percent, so cache the formatted string
+                key = (i, hit, progress)
+                row = self._row_cache.get(key)
+                if row is None:
+                    if hit:
+                        status = "✅"
+                        bar = "█" * 12
+                    elif progress:
+                        status = "🎯"
+                        filled = int(progress / 100 * 12)
+                        bar = "█" * filled + "░" * (12 - filled)
+                    else:
+                        status = "⏸"
+                        bar = "░" * 12
+                    row = f"{status} [bold]${price:.4f}[/bold]  {amount:.2f} {base_currency}  [{bar}] {progress}%\n"
+                    self._row_cache[key] = row
+
+                content += row
+
+        # String comparison is far cheaper than a Textual repaint
+        if content == self._last_content:
+            return
+        self._last_content = content
 
         threshold_widget = self.query_one("#threshold-content")
         threshold_widget.update(content)